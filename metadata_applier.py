@@ -19,45 +19,95 @@ Requirements:
 """
 from __future__ import annotations
 import argparse
+import codecs
 import csv
+import hashlib
+import json
+import multiprocessing
 import os
+import re
+import shutil
 import sys
 import subprocess
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain, repeat
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, Iterator, List, Set, Tuple, TypeVar
 
-def find_file_case_insensitive(root: Path, target_name: str) -> Path | None:
-    """Attempt to locate a file by exact name first, then case-insensitive within root.
-    Returns a Path if found, else None.
+T = TypeVar("T")
+
+# Below this many files a worker pool costs more to start than it saves
+PARALLEL_THRESHOLD = 64
+
+# Options shared by every write, declared once via -common_args instead of repeated per command.
+# -P keeps the file modification time, so re-tagging does not make files look newly edited.
+# -q drops the "N image files updated" chatter; errors still arrive on stderr, which is all we parse.
+WRITE_ARGS = ["-q", "-P", "-overwrite_original"]
+
+# Upper bound on files per exiftool command group, so one group's output stays bounded
+MAX_GROUP_FILES = 500
+
+# ProcessPoolExecutor rejects more workers than this on Windows (WaitForMultipleObjects limit)
+WINDOWS_MAX_WORKERS = 61
+
+def build_dir_index(root: str) -> Tuple[Dict[str, str], Set[str]]:
+    """Index the files in root once (non recursive).
+    Returns (by_lower, clashes): by_lower maps each lowercase name to one on-disk name, so a
+    file costs a single entry; clashes holds the other names of case-only duplicates
+    (e.g. IMG.JPG next to img.jpg) so an exact match can still win for them.
+    Only names are stored; a full path is built just for the files a CSV row actually matches.
     """
-    exact = root / target_name
-    if exact.exists():
-        return exact
-    # Fallback: case-insensitive scan of the directory (non recursive by default)
-    lower = target_name.lower()
-    for p in root.iterdir():
-        try:
-            if p.is_file() and p.name.lower() == lower:
-                return p
-        except PermissionError:
-            continue
-    return None
+    by_lower: Dict[str, str] = {}
+    clashes: Set[str] = set()
+    # DirEntry carries the file type from readdir itself, so is_file() only stats symlinks
+    with os.scandir(root) as it:
+        for entry in it:
+            try:
+                if entry.is_file():
+                    name = entry.name
+                    first = by_lower.setdefault(name.lower(), name)
+                    if first != name:
+                        clashes.add(name)
+            except PermissionError:
+                continue
+    return by_lower, clashes
+
+
+def find_file_case_insensitive(root: str, index: Tuple[Dict[str, str], Set[str]], target_name: str) -> str | None:
+    """Attempt to locate a file by exact name first, then case-insensitive, using build_dir_index().
+    Returns the file's path (as a plain string) if found, else None.
+    """
+    by_lower, clashes = index
+    name = by_lower.get(target_name.lower())
+    if name is None:
+        return None
+    if name != target_name and target_name in clashes:
+        name = target_name
+    return os.path.join(root, name)
 
 
-def build_keywords_args(keywords_str: str) -> List[str]:
-    """Split a comma-separated keywords string into multiple -Keywords= arguments.
+# Comma or semicolon, with any surrounding whitespace, in one C-level regex split
+KEYWORD_SEPARATOR = re.compile(r"\s*[,;]\s*")
+
+
+def split_keywords(keywords_str: str | None) -> List[str]:
+    """Split a comma/semicolon-separated keywords string into a list.
     Trims whitespace; skips empty entries.
     """
-    # Normalize various separators (comma, semicolon)
-    if keywords_str is None:
+    if not keywords_str:
         return []
-    raw = [k.strip() for k in keywords_str.replace(";", ",").split(",")]
-    return [f"-Keywords={k}" for k in raw if k]
+    return [k for k in KEYWORD_SEPARATOR.split(keywords_str.strip()) if k]
+
+
+def build_keywords_args(keywords: List[str]) -> List[str]:
+    """Turn already-split keywords into multiple -Keywords= arguments."""
+    return [f"-Keywords={k}" for k in keywords]
 
 
-def run_exiftool(exiftool: str, file_path: Path, title: str | None, keywords: str | None, description: str | None, dry_run: bool) -> Tuple[bool, str]:
-    """Invoke exiftool to write Title, Keywords, and Description. Returns (ok, message)."""
-    args = [exiftool]
+def build_tag_args(title: str | None, keywords: List[str], description: str | None) -> List[str]:
+    """Build the exiftool tag arguments for Title, Keywords, and Description."""
+    args: List[str] = []
 
     # Prefer explicit XMP where sensible; exiftool will map generically if tag is available
     if title:
@@ -65,34 +115,333 @@ def run_exiftool(exiftool: str, file_path: Path, title: str | None, keywords: st
         # Also set XMP:Title for broader compatibility
         args.append(f"-XMP:Title={title}")
 
-    kw_args = build_keywords_args(keywords)
-    if kw_args:
-        args.extend(kw_args)
+    if keywords:
+        args.extend(build_keywords_args(keywords))
         # Mirror into XMP:Subject as well (commonly used for keywords)
         # exiftool supports -Subject= for XMP:Subject
-        subject_args = [a.replace("-Keywords=", "-Subject=") for a in kw_args]
-        args.extend(subject_args)
+        args.extend([f"-Subject={k}" for k in keywords])
 
     if description:
         args.append(f"-Description={description}")
         # Also set XMP:Description for broader compatibility
         args.append(f"-XMP:Description={description}")
 
-    # Overwrite in place; exiftool writes a _original backup unless told otherwise
-    args.extend(["-overwrite_original", str(file_path)])
+    return args
+
+
+@lru_cache(maxsize=4096)
+def compile_tag_args(title: str | None, keywords_str: str | None, description: str | None) -> Tuple[str, ...]:
+    """Split keywords and build the tag arguments once per distinct (title, keywords, description).
+    Stock batches repeat the same metadata across many rows; repeats are a cache hit.
+    """
+    return tuple(build_tag_args(title, split_keywords(keywords_str), description))
 
-    if dry_run:
-        return True, "DRY-RUN: " + " ".join([repr(x) for x in args])
 
+def argfile_line(arg: str) -> str:
+    """Encode one argument as a line of exiftool's -@ argfile stream.
+    The stream holds one argument per line, so an argument with a line break (a multi-line
+    Description) is sent in exiftool's "#[CSTR]" C-string form to keep it one argument.
+
+    >>> argfile_line("-Description=first line\\nsecond line")
+    '#[CSTR]-Description=first line\\\\nsecond line'
+    >>> argfile_line("-Title=plain")
+    '-Title=plain'
+    """
+    if "\n" not in arg and "\r" not in arg:
+        return arg
+    escaped = arg.replace("\\", "\\\\").replace("\n", "\\n").replace("\r", "\\r").replace("\t", "\\t").replace('"', '\\"')
+    return "#[CSTR]" + escaped
+
+
+class ExifToolDaemon:
+    """A long-lived `exiftool -stay_open True -@ -` process.
+    Argument groups are streamed over stdin, each terminated by a numbered -execute;
+    output is read back up to the matching {readyN} marker. Started lazily on first use.
+    """
+
+    def __init__(self, exiftool: str, common_args: List[str] | None = None):
+        self.exiftool = exiftool
+        # Overwrite in place; exiftool writes a _original backup unless told otherwise
+        self.common_args = common_args if common_args is not None else list(WRITE_ARGS)
+        self._proc: subprocess.Popen | None = None
+        self._stderr_reader: ThreadPoolExecutor | None = None
+        self._seq = 0
+
+    def __enter__(self) -> "ExifToolDaemon":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def start(self) -> None:
+        if self._proc is not None:
+            return
+        args = [self.exiftool, "-stay_open", "True", "-@", "-", "-common_args", "-charset", "filename=utf8", *self.common_args]
+        # On POSIX, close_fds=False plus an executable with a directory part (resolved from PATH here)
+        # lets subprocess take its os.posix_spawn fast path instead of fork+exec.
+        # Python's own descriptors are non-inheritable (PEP 446), so nothing extra leaks into exiftool
+        executable = shutil.which(self.exiftool) or self.exiftool
+        self._proc = subprocess.Popen(
+            args, executable=executable, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+            close_fds=(os.name == "nt"),
+        )
+        # stderr is drained on its own thread while stdout is read, so a group with many errors
+        # cannot fill the stderr pipe and stall exiftool while we wait for the stdout marker
+        self._stderr_reader = ThreadPoolExecutor(max_workers=1)
+
+    def execute(self, args: List[str]) -> Tuple[str, str, int | None]:
+        """Run one argument group and return its (stdout, stderr, exit status).
+        The status is None when this exiftool is too old to report ${status}.
+        """
+        self.start()
+        self._seq += 1
+        ready = f"{{ready{self._seq}}}"
+        # -echo4 prints the same marker to stderr once the group is done, so both pipes can be split;
+        # it also carries the group's exit status, which exiftool expands in place of ${status}
+        lines = [*map(argfile_line, args), "-echo4", ready + " ${status}", f"-execute{self._seq}"]
+        marker = ready.encode("ascii")
+        err_future = self._stderr_reader.submit(self._read_until, self._proc.stderr, marker)
+        self._proc.stdin.write(("\n".join(lines) + "\n").encode("utf-8"))
+        self._proc.stdin.flush()
+        out, _ = self._read_until(self._proc.stdout, marker)
+        err, tail = err_future.result()
+        return out, err, int(tail) if tail.isdigit() else None
+
+    @staticmethod
+    def _read_until(stream, marker: bytes) -> Tuple[str, str]:
+        """Collect raw lines up to the marker line, then decode the group's output once.
+        Returns the output and whatever followed the marker on its line.
+        """
+        chunks = []
+        while True:
+            line = stream.readline()
+            if not line:
+                raise EOFError(f"exiftool exited before {marker.decode()}")
+            line = line.rstrip(b"\r\n")
+            if line.split(b" ", 1)[0] == marker:
+                tail = line[len(marker):].decode("ascii", errors="replace").strip()
+                return b"".join(chunks).decode("utf-8", errors="replace").strip(), tail
+            chunks.append(line + b"\n")
+
+    def close(self) -> None:
+        if self._proc is None:
+            return
+        proc, self._proc = self._proc, None
+        try:
+            proc.stdin.write(b"-stay_open\nFalse\n")
+            proc.stdin.close()
+        except OSError:
+            pass
+        try:
+            proc.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+        # Once exiftool is gone a pending stderr read sees EOF, so this cannot block
+        self._stderr_reader.shutdown(wait=True)
+        self._stderr_reader = None
+
+
+def group_results(files: List[str], err: str, status: int | None) -> List[Tuple[bool, str]]:
+    """Attribute one exiftool group's result to each of its files.
+    exiftool reports per-file failures as "Error: <reason> - <file>"; only those files fail.
+    An error naming no file fails the whole group only when the group's exit status says
+    exiftool failed without writing anything it could name (e.g. a bad tag argument).
+    """
+    file_set = set(files)
+    per_file: Dict[str, List[str]] = {}
+    general: List[str] = []
+    for line in err.splitlines():
+        if not line.startswith("Error"):
+            continue
+        # Try each " - " split point, since file names may contain " - " themselves
+        owner = None
+        pos = line.find(" - ")
+        while pos != -1:
+            if line[pos + 3:] in file_set:
+                owner = line[pos + 3:]
+                break
+            pos = line.find(" - ", pos + 1)
+        if owner is None:
+            general.append(line)
+        else:
+            per_file.setdefault(owner, []).append(line)
+    # Without a status (old exiftool) an unattributed error is the only failure signal left
+    if not per_file and (status or (status is None and general)):
+        reason = "\n".join(general) or f"exiftool exited with status {status}"
+        return [(False, reason)] * len(files)
+    return [(False, "\n".join(per_file[f])) if f in per_file else (True, "Updated") for f in files]
+
+
+def run_exiftool(exiftool: str, jobs: List[Tuple[List[str], List[str]]], dry_run: bool) -> List[Tuple[bool, str]]:
+    """Write all (file_paths, tag_args) jobs through one persistent exiftool process.
+    Files sharing a tag set go in a single command group, so exiftool parses the tags once.
+    Returns one (ok, message) per file, in job order.
+    """
+    if dry_run:
+        return [
+            (True, "DRY-RUN: " + " ".join([repr(x) for x in [exiftool, *WRITE_ARGS, *tag_args, file_path]]))
+            for file_paths, tag_args in jobs
+            for file_path in file_paths
+        ]
+
+    total = sum(len(file_paths) for file_paths, _ in jobs)
+    results: List[Tuple[bool, str]] = []
     try:
-        result = subprocess.run(args, capture_output=True, text=True, check=False)
-        if result.returncode == 0:
-            return True, (result.stdout.strip() or "Updated")
+        with ExifToolDaemon(exiftool) as et:
+            for file_paths, tag_args in jobs:
+                for start in range(0, len(file_paths), MAX_GROUP_FILES):
+                    batch = file_paths[start:start + MAX_GROUP_FILES]
+                    _, err, status = et.execute([*tag_args, *batch])
+                    results.extend(group_results(batch, err, status))
+    except FileNotFoundError:
+        msg = f"exiftool not found at '{exiftool}'. Install it or pass --exiftool."
+        results.extend([(False, msg)] * (total - len(results)))
+    except (EOFError, OSError) as e:
+        results.extend([(False, f"exiftool stopped unexpectedly: {e}")] * (total - len(results)))
+    return results
+
+
+def chunk_list(items: List[T], n: int) -> List[List[T]]:
+    """Split items into at most n contiguous chunks of near-equal size."""
+    n = max(1, min(n, len(items)))
+    size, extra = divmod(len(items), n)
+    chunks = []
+    start = 0
+    for i in range(n):
+        end = start + size + (1 if i < extra else 0)
+        chunks.append(items[start:end])
+        start = end
+    return chunks
+
+
+def regroup(units: List[Tuple[List[str], str]]) -> List[Tuple[List[str], List[str]]]:
+    """Merge consecutive (tag_args, file_path) units sharing the same tag_args back into jobs."""
+    jobs: List[Tuple[List[str], List[str]]] = []
+    for tag_args, file_path in units:
+        if jobs and jobs[-1][1] is tag_args:
+            jobs[-1][0].append(file_path)
         else:
-            msg = (result.stderr or result.stdout).strip()
-            return False, msg
+            jobs.append(([file_path], tag_args))
+    return jobs
+
+
+def init_worker(counter) -> None:
+    """Pool initializer: pin this worker (and the exiftool it starts) to one CPU and
+    put it in the best-effort I/O class, so the kernel can merge the workers' disk I/O.
+    Both are Linux-only and silently skipped elsewhere.
+    """
+    with counter.get_lock():
+        worker_id = counter.value
+        counter.value += 1
+    if hasattr(os, "sched_setaffinity"):
+        cpus = sorted(os.sched_getaffinity(0))
+        try:
+            os.sched_setaffinity(0, {cpus[worker_id % len(cpus)]})
+        except OSError:
+            pass
+    ionice = shutil.which("ionice") if sys.platform.startswith("linux") else None
+    if ionice:
+        subprocess.run([ionice, "-c2", "-n0", "-p", str(os.getpid())],
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+
+
+def inode_order(path: str, known: int | None = None) -> int:
+    """Sort key placing files in on-disk (inode) order; unreadable files sort first.
+    known is an inode number the caller already has from an earlier stat.
+    """
+    if known is not None:
+        return known
+    try:
+        return os.stat(path).st_ino
+    except OSError:
+        return 0
+
+
+def run_exiftool_parallel(exiftool: str, jobs: List[Tuple[List[str], List[str]]], workers: int) -> List[Tuple[bool, str]]:
+    """Shard files across worker processes, each driving its own exiftool daemon.
+    Large groups are split between workers too. Results are returned in job order.
+    """
+    if sys.platform == "win32":
+        workers = min(workers, WINDOWS_MAX_WORKERS)
+    units = [(tag_args, file_path) for file_paths, tag_args in jobs for file_path in file_paths]
+    chunks = [regroup(chunk) for chunk in chunk_list(units, workers)]
+    results: List[Tuple[bool, str]] = []
+    # forkserver workers start from a small server process instead of forking this (job-laden) one
+    methods = multiprocessing.get_all_start_methods()
+    mp_context = multiprocessing.get_context("forkserver" if "forkserver" in methods else None)
+    counter = mp_context.Value("i", 0)
+    with ProcessPoolExecutor(max_workers=len(chunks), mp_context=mp_context,
+                             initializer=init_worker, initargs=(counter,)) as pool:
+        for chunk_results in pool.map(run_exiftool, repeat(exiftool), chunks, repeat(False)):
+            results.extend(chunk_results)
+    return results
+
+
+class OutputBuffer:
+    """Collect report lines and write them to stdout in blocks instead of one print() per line.
+    Each console write is costly on Windows, so thousands of rows become a handful of writes.
+    """
+
+    def __init__(self, block_size: int = 1000):
+        self.block_size = block_size
+        self._lines: List[str] = []
+
+    def add(self, line: str) -> None:
+        self._lines.append(line)
+        if len(self._lines) >= self.block_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._lines:
+            sys.stdout.write("\n".join(self._lines) + "\n")
+            sys.stdout.flush()
+            self._lines.clear()
+
+
+@lru_cache(maxsize=4096)
+def tag_signature(tag_args: Tuple[str, ...]) -> str:
+    """Stable hash of a file's tag arguments, used to detect unchanged metadata between runs."""
+    return hashlib.sha1("\0".join(tag_args).encode("utf-8")).hexdigest()
+
+
+def load_cache(cache_path: Path) -> Dict[str, Dict[str, object]]:
+    """Load the manifest of previously written files: path -> {tags, size, mtime_ns}."""
+    try:
+        with cache_path.open("r", encoding="utf-8") as f:
+            data = json.load(f)
     except FileNotFoundError:
-        return False, f"exiftool not found at '{exiftool}'. Install it or pass --exiftool."
+        return {}
+    except (OSError, ValueError) as e:
+        print(f"(Catatan: cache tidak bisa dibaca, dimulai dari kosong: {e})", file=sys.stderr)
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    # Drop hand-edited or old-format entries; a missing entry only means the file is rewritten
+    return {path: entry for path, entry in data.items() if isinstance(entry, dict)}
+
+
+def save_cache(cache_path: Path, cache: Dict[str, Dict[str, object]]) -> None:
+    """Write the manifest atomically so an interrupted run never leaves a truncated file.
+    A cache that cannot be written is reported, not fatal: the files are already updated.
+    """
+    tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+    try:
+        with tmp_path.open("w", encoding="utf-8") as f:
+            json.dump(cache, f, ensure_ascii=False)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        print(f"(Catatan: cache tidak bisa disimpan: {e})", file=sys.stderr)
+
+
+def is_cached(cache: Dict[str, Dict[str, object]], target: str, signature: str, st: os.stat_result | None) -> bool:
+    """True if target was last written with the same tags and has not changed on disk since.
+    st is the caller's os.stat() of target (None if it could not be read).
+    """
+    entry = cache.get(target)
+    if not isinstance(entry, dict) or st is None or entry.get("tags") != signature:
+        return False
+    return entry.get("size") == st.st_size and entry.get("mtime_ns") == st.st_mtime_ns
 
 
 def parse_args() -> argparse.Namespace:
@@ -102,6 +451,10 @@ def parse_args() -> argparse.Namespace:
     p.add_argument("--encoding", default="utf-8-sig", help="CSV encoding (default: utf-8-sig, handles BOM)")
     p.add_argument("--delimiter", default=",", help="CSV delimiter (default: ,)")
     p.add_argument("--exiftool", default="exiftool", help="Path to exiftool executable (default: exiftool)")
+    p.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Number of parallel exiftool processes (default: CPU count)")
+    p.add_argument("--cache", nargs="?", const=".metadata_applier_cache.json", default=None,
+                   help="Skip files already written with the same metadata, tracked in this JSON manifest "
+                        "(default when given without a path: .metadata_applier_cache.json in --dir)")
     p.add_argument("--dry-run", action="store_true", help="Show what would be written without changing files")
     p.add_argument("--recursive", action="store_true", help="(Not used) Placeholder for future recursion support")
     return p.parse_args()
@@ -125,21 +478,32 @@ def find_column_key(available_keys: set, target_name: str) -> str | None:
     return None
 
 
-def read_csv_rows(csv_path: Path, encoding: str, delimiter: str) -> List[Dict[str, str]]:
+def read_csv_rows(csv_path: Path, encoding: str, delimiter: str) -> Iterator[List[str]]:
+    """Yield the header (names stripped) and then each data row as a list of raw values.
+    The file stays open while iterating; callers pick and strip columns by position.
+    """
     if not csv_path.exists():
         print(f"CSV tidak ditemukan: {csv_path}", file=sys.stderr)
         sys.exit(1)
+    # utf-8-sig decodes exactly like utf-8 but also drops a leading BOM (common in Excel exports)
+    if codecs.lookup(encoding).name == "utf-8":
+        encoding = "utf-8-sig"
     try:
         with csv_path.open("r", newline="", encoding=encoding) as f:
-            reader = csv.DictReader(f, delimiter=delimiter)
+            # Plain csv.reader: positional rows, no per-row dict like DictReader builds
+            reader = csv.reader(f, delimiter=delimiter)
+            header = next(reader, None)
+            if header is None:
+                return
             # Normalize headers (strip surrounding spaces)
-            reader.fieldnames = [fn.strip() for fn in (reader.fieldnames or [])]
-            rows = []
+            yield [fn.strip() for fn in header]
+            width = len(header)
+            # Skip blank lines like DictReader; short rows are padded with "" so every column exists
             for row in reader:
-                # Strip whitespace from values
-                norm = {k.strip(): (v.strip() if isinstance(v, str) else v) for k, v in row.items()}
-                rows.append(norm)
-            return rows
+                if row:
+                    if len(row) < width:
+                        row.extend([""] * (width - len(row)))
+                    yield row
     except UnicodeDecodeError as e:
         print(f"Gagal membaca CSV (encoding): {e}", file=sys.stderr)
         sys.exit(1)
@@ -175,13 +539,29 @@ def main() -> None:
     print(f"ExifTool: {args.exiftool}")
     print(f"Mode    : {'DRY-RUN' if args.dry_run else 'APPLY'}\n")
 
+    # Optional manifest of earlier writes; relative paths live next to the media files
+    cache_path = (base_dir / args.cache).resolve() if args.cache else None
+    cache = load_cache(cache_path) if cache_path else {}
+
+    # The per-row code works on plain strings; Path objects are only used at the CLI boundary
+    base_dir_str = str(base_dir)
+
+    # Scan the folder on a background thread while the CSV is parsed below; the two touch
+    # disjoint resources, so the wall time is roughly max(parse, scan) instead of their sum
+    scanner = ThreadPoolExecutor(max_workers=1)
+    index_future = scanner.submit(build_dir_index, base_dir_str)
+    scanner.shutdown(wait=False)
+
+    # Rows are streamed; the header and first row are pulled up front to detect the columns
     rows = read_csv_rows(csv_path, args.encoding, args.delimiter)
-    if not rows:
+    header = next(rows, None)
+    first = next(rows, None)
+    if first is None:
         print("CSV kosong atau tidak memiliki baris data.")
         return
 
     # Find required columns using flexible matching (case-insensitive, ignores special chars)
-    available_keys = set(rows[0].keys())
+    available_keys = set(header)
     filename_key = find_column_key(available_keys, "Filename")
     title_key = find_column_key(available_keys, "Title")
     keywords_key = find_column_key(available_keys, "Keywords")
@@ -204,59 +584,144 @@ def main() -> None:
     if not description_key:
         print("(Catatan: Kolom 'Description' tidak ditemukan. Metadata Description akan dilewati.)")
     
-    # Store the actual column keys we'll use
-    column_map = {
-        "filename": filename_key,
-        "title": title_key,
-        "keywords": keywords_key,
-        "description": description_key
-    }
-
-    total = len(rows)
+    # Column positions, resolved once (the last duplicate header wins, as with DictReader)
+    positions = {name: i for i, name in enumerate(header)}
+    filename_col = positions[filename_key]
+    title_col = positions[title_key]
+    keywords_col = positions[keywords_key]
+    description_col = positions[description_key] if description_key else None
+
     ok_count = 0
     miss_count = 0
+    skip_count = 0
+    dup_count = 0
+    empty_count = 0
     err_count = 0
     details: List[str] = []
 
-    for idx, row in enumerate(rows, start=1):
-        # Use the mapped column keys (case-insensitive, flexible)
-        filename = row.get(column_map["filename"], "").strip()
-        title = row.get(column_map["title"], "").strip() or None
-        keywords = row.get(column_map["keywords"], "").strip() or None
-        description = (row.get(column_map["description"], "").strip() or None) if column_map["description"] else None
+    # Parse pass: reduce each row to (row number, file name, tag args) while the folder scan runs
+    parsed: List[Tuple[int, str, Tuple[str, ...]]] = []
+    for idx, row in enumerate(chain([first], rows), start=1):
+        # Only the four mapped columns are stripped
+        filename = row[filename_col].strip()
+        title = row[title_col].strip() or None
+        keywords = row[keywords_col].strip() or None
+        description = (row[description_col].strip() or None) if description_col is not None else None
 
         # Normalize path separators potentially present in CSV (we expect just filenames)
-        filename_only = Path(filename).name
-        target = find_file_case_insensitive(base_dir, filename_only)
+        parsed.append((idx, os.path.basename(filename), compile_tag_args(title, keywords, description)))
+    total = len(parsed)
+
+    # The folder is scanned once; every row is then an O(1) lookup instead of a directory walk
+    index = index_future.result()
+
+    # Resolve pass: match every row to a file so exiftool can be started once for the whole batch.
+    # Rows with identical tags are grouped so each distinct tag set is written by one exiftool command.
+    # A file listed on several rows is written once, with its last row's tags (as the old per-row
+    # loop would have left it); this also keeps a file out of two groups or two workers at once.
+    latest: Dict[str, Tuple[int, str, Tuple[str, ...]]] = {}
+    notices: List[str] = []
+    for idx, filename_only, tag_args in parsed:
+        target = find_file_case_insensitive(base_dir_str, index, filename_only)
 
-        header = f"[{idx}/{total}] {filename_only}"
         if not target:
-            print(f"{header} — ❌ File tidak ditemukan")
+            notices.append(f"[{idx}/{total}] {filename_only} — ❌ File tidak ditemukan")
             miss_count += 1
             details.append(f"MISS : {filename_only}")
             continue
 
-        print(f"{header} — updating metadata…")
-        ok, msg = run_exiftool(args.exiftool, target, title, keywords, description, args.dry_run)
-        if ok:
-            print(f"   ✅ {target.name}: {msg}")
-            ok_count += 1
-            details.append(f"OK   : {target.name}")
-        else:
-            print(f"   ❌ {target.name}: {msg}")
-            err_count += 1
-            details.append(f"ERROR: {target.name} — {msg}")
+        # With no tags to write exiftool would read the file and dump its tags instead
+        if not tag_args:
+            notices.append(f"[{idx}/{total}] {filename_only} — ⚠️ Title/Keywords/Description kosong, dilewati")
+            empty_count += 1
+            details.append(f"EMPTY: {filename_only}")
+            continue
+
+        previous = latest.get(target)
+        if previous is not None:
+            dup_count += 1
+            details.append(f"DUP  : {previous[1]} (baris {previous[0]} ditimpa baris {idx})")
+        latest[target] = (idx, filename_only, tag_args)
+
+    # Members are (row number, CSV name, path, inode if already stat'ed)
+    groups: Dict[Tuple[str, ...], List[Tuple[int, str, str, int | None]]] = {}
+    for target, (idx, filename_only, tag_args) in latest.items():
+        st = None
+        if cache_path and target in cache:
+            try:
+                st = os.stat(target)
+            except OSError:
+                pass
+            if is_cached(cache, target, tag_signature(tag_args), st):
+                skip_count += 1
+                details.append(f"SKIP : {os.path.basename(target)}")
+                continue
+        groups.setdefault(tag_args, []).append((idx, filename_only, target, st.st_ino if st else None))
+
+    out = OutputBuffer()
+    for line in notices:
+        out.add(line)
+    out.flush()
+
+    file_count = total - miss_count - empty_count - skip_count - dup_count
+    # Small batches (and dry-runs) stay serial: spawning workers would dominate the run time
+    parallel = not args.dry_run and args.workers > 1 and file_count >= PARALLEL_THRESHOLD
+    if parallel:
+        # Hand workers their files in inode order so reads/rewrites follow the on-disk layout (fewer seeks)
+        for members in groups.values():
+            members.sort(key=lambda m: inode_order(m[2], m[3]))
+
+    jobs = [([m[2] for m in members], list(tag_args)) for tag_args, members in groups.items()]
+    if jobs:
+        print(f"\nupdating metadata for {file_count} file(s) in {len(jobs)} group(s)…")
+    if parallel:
+        results = run_exiftool_parallel(args.exiftool, jobs, args.workers)
+    else:
+        results = run_exiftool(args.exiftool, jobs, args.dry_run)
+
+    result_iter = iter(results)
+    for tag_args, members in groups.items():
+        signature = tag_signature(tag_args) if cache_path else ""
+        for (idx, filename_only, target, _), (ok, msg) in zip(members, result_iter):
+            name = os.path.basename(target)
+            out.add(f"[{idx}/{total}] {filename_only}")
+            if ok:
+                out.add(f"   ✅ {name}: {msg}")
+                ok_count += 1
+                details.append(f"OK   : {name}")
+                if cache_path and not args.dry_run:
+                    try:
+                        st = os.stat(target)
+                    except OSError:
+                        continue
+                    cache[target] = {"tags": signature, "size": st.st_size, "mtime_ns": st.st_mtime_ns}
+            else:
+                out.add(f"   ❌ {name}: {msg}")
+                err_count += 1
+                details.append(f"ERROR: {name} — {msg}")
+
+    out.flush()
+
+    if cache_path and not args.dry_run:
+        save_cache(cache_path, cache)
 
     print("\n──── Summary ────")
     print(f"Total rows : {total}")
     print(f"Updated    : {ok_count}")
     print(f"Not found  : {miss_count}")
+    if dup_count:
+        print(f"Duplicates : {dup_count}")
+    if empty_count:
+        print(f"No metadata: {empty_count}")
+    if cache_path:
+        print(f"Unchanged  : {skip_count}")
     print(f"Errors     : {err_count}")
 
     if details:
         print("\nDetails:")
         for d in details:
-            print(" - ", d)
+            out.add(f" -  {d}")
+        out.flush()
 
     if args.dry_run:
         print("\n(Ini hanyalah simulasi. Jalankan ulang TANPA --dry-run untuk menerapkan perubahan.)")